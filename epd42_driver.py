@@ -15,11 +15,23 @@ Pin mapping (WeAct Raspberry Pi header pinout):
 
 Note: Hardware SPI1 CS1 (Pin 26 / PH9) is NOT used.
       CS is controlled manually via GPIO for proper DC/CS timing.
+      If CS is wired to the controller's hardware CE pin instead, pass
+      pins={"cs": None, ...} and the kernel toggles CS for each transfer,
+      leaving only DC to be driven from Python.
+
+DMA: frame writes are large enough for the SPI controller to use DMA, so the
+CPU sleeps through the transfer instead of feeding the FIFO. On the Pi
+(spi-bcm2835) the stock device tree already wires spi0 to DMA. On the H618
+(spi-sun6i) the spi1 node needs dmas/dma-names in the overlay. Raising the
+spidev buffer size (spidev.bufsiz=16384 on the kernel command line) lets a
+whole 15000-byte frame go out as one transfer instead of four.
 """
 
+import os
 import spidev
 import gpiod
 import time
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 
 # Display dimensions
@@ -37,9 +49,20 @@ DEFAULT_PINS = {
 # Default SPI settings
 DEFAULT_SPI_BUS = 0
 DEFAULT_SPI_DEV = 0
-DEFAULT_SPI_SPEED = 4_000_000  # 4 MHz
+DEFAULT_SPI_SPEED = 16_000_000  # 16 MHz (SSD1683 write clock max is 20 MHz)
 DEFAULT_SPI_MODE = 0b00        # SPI Mode 0
 
+SPIDEV_BUFSIZ_PARAM = "/sys/module/spidev/parameters/bufsiz"
+
+
+def _spidev_bufsiz():
+    """Largest single transfer the spidev driver accepts (module param, default 4096)."""
+    try:
+        with open(SPIDEV_BUFSIZ_PARAM) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return 4096
+
 
 class EPD42:
     """Driver for WeAct Studio 4.2" E-Paper (SSD1683, 400x300).
@@ -47,6 +70,9 @@ class EPD42:
     Supports full refresh, fast refresh, and partial refresh modes.
     """
 
+    # Solid-color frames for clear(), keyed by fill byte
+    _CLEAR_CACHE = {}
+
     def __init__(self, pins=None, spi_bus=DEFAULT_SPI_BUS, spi_dev=DEFAULT_SPI_DEV,
                  spi_speed=DEFAULT_SPI_SPEED, spi_mode=DEFAULT_SPI_MODE,
                  gpiochip="gpiochip0"):
@@ -55,10 +81,13 @@ class EPD42:
 
         Args:
             pins: dict with keys 'dc', 'cs', 'rst', 'busy' mapping to GPIO line numbers.
-                  Defaults to Orange Pi Zero 2W WeAct pinout.
+                  Defaults to Orange Pi Zero 2W WeAct pinout. Set 'cs' to None
+                  when CS is wired to the hardware CE pin of spi_dev.
             spi_bus: SPI bus number (default 0)
             spi_dev: SPI device number (default 0)
-            spi_speed: SPI clock speed in Hz (default 4MHz)
+            spi_speed: SPI clock speed in Hz (default 16MHz). The controller
+                       rounds down to the nearest divisor it supports; drop to
+                       4MHz if long jumper wires cause corrupted frames.
             spi_mode: SPI mode (default 0)
             gpiochip: GPIO chip name (default "gpiochip1")
         """
@@ -66,8 +95,13 @@ class EPD42:
         self.height = EPD_HEIGHT
         self.pins = pins or DEFAULT_PINS.copy()
         self._partial_count = 0
-        self._last_full_refresh = time.time()
+        self._last_full_refresh = time.monotonic()
         self._full_refresh_interval = 300  # seconds (5 minutes)
+        self._erased_pixels = 0  # black->white transitions since last full refresh
+        self._ghost_limit = EPD_WIDTH * EPD_HEIGHT  # erasures allowed before one
+        self._prev_buffer = None  # frame currently held in NEW RAM
+        self._old_ram_synced = False  # OLD RAM matches _prev_buffer
+        self._executor = None  # background worker, see _worker()
 
         # SPI setup
         self.spi = spidev.SpiDev()
@@ -75,28 +109,53 @@ class EPD42:
         self.spi.max_speed_hz = spi_speed
         self.spi.mode = spi_mode
 
+        # Data goes out through write(2) on the device node: one syscall per
+        # bufsiz chunk, using the mode/speed configured above via spidev
+        self._spi_fd = os.open(f"/dev/spidev{spi_bus}.{spi_dev}", os.O_WRONLY)
+        self._spi_bufsiz = _spidev_bufsiz()
+
         # GPIO setup
         self.chip = gpiod.Chip(gpiochip)
 
-        self.dc = self.chip.get_line(self.pins["dc"])
-        self.dc.request(consumer="epd", type=gpiod.LINE_REQ_DIR_OUT, default_vals=[1])
-
-        self.cs = self.chip.get_line(self.pins["cs"])
-        self.cs.request(consumer="epd", type=gpiod.LINE_REQ_DIR_OUT, default_vals=[1])
+        # CS via GPIO, or None to let the SPI controller drive its CE pin.
+        # With GPIO CS, DC and CS are one bulk request so a single
+        # set_values() ioctl moves both (lines of a bulk request must not be
+        # set individually under libgpiod v1).
+        self.dc = None
+        self._dc_cs = None
+        if self.pins.get("cs") is None:
+            self.dc = self.chip.get_line(self.pins["dc"])
+            self.dc.request(consumer="epd", type=gpiod.LINE_REQ_DIR_OUT, default_vals=[1])
+        else:
+            self._dc_cs = self.chip.get_lines([self.pins["dc"], self.pins["cs"]])
+            self._dc_cs.request(consumer="epd", type=gpiod.LINE_REQ_DIR_OUT,
+                                default_vals=[1, 1])
+            # CS is ours: keep the controller from pulsing its own CE line
+            # between the bufsiz-sized chunks of a bulk write
+            try:
+                self.spi.no_cs = True
+            except OSError:
+                pass  # controller can't release CE; harmless while it's unwired
 
         self.rst = self.chip.get_line(self.pins["rst"])
         self.rst.request(consumer="epd", type=gpiod.LINE_REQ_DIR_OUT, default_vals=[1])
 
         self.busy = self.chip.get_line(self.pins["busy"])
-        self.busy.request(consumer="epd", type=gpiod.LINE_REQ_DIR_IN,
+        # Falling-edge events let _wait_busy() sleep until the kernel IRQ fires
+        self.busy.request(consumer="epd", type=gpiod.LINE_REQ_EV_FALLING_EDGE,
                           flags=gpiod.LINE_REQ_FLAG_BIAS_DISABLE)
 
     def close(self):
         """Release all GPIO lines and close SPI."""
-        self.dc.release()
-        self.cs.release()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)  # let queued refreshes finish
+        if self._dc_cs is not None:
+            self._dc_cs.release()
+        else:
+            self.dc.release()
         self.rst.release()
         self.busy.release()
+        os.close(self._spi_fd)
         self.spi.close()
 
     def __enter__(self):
@@ -108,85 +167,148 @@ class EPD42:
     # --- Low-level SPI/GPIO ---
 
     def _wait_busy(self, timeout=30):
-        """Wait for BUSY pin to go LOW (idle). Returns True if cleared."""
-        start = time.time()
+        """Wait for BUSY pin to go LOW (idle). Returns True if cleared.
+
+        Blocks on a falling-edge event instead of polling. Edges queued by
+        earlier refreshes are drained and the level re-checked, so a stale
+        event can't end the wait early.
+        """
+        deadline = time.monotonic() + timeout
         while self.busy.get_value() == 1:
-            if time.time() - start > timeout:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return False
-            time.sleep(0.01)
+            sec = int(remaining)
+            if self.busy.event_wait(sec=sec, nsec=int((remaining - sec) * 1e9)):
+                self.busy.event_read_multiple()
         return True
 
-    def _send_command(self, cmd):
-        """Send a command byte (DC=LOW)."""
-        self.dc.set_value(0)
-        self.cs.set_value(0)
-        self.spi.writebytes([cmd])
-        self.cs.set_value(1)
-        self.dc.set_value(1)
-
-    def _send_data(self, val):
-        """Send a single data byte (DC=HIGH)."""
-        self.dc.set_value(1)
-        self.cs.set_value(0)
-        self.spi.writebytes([val])
-        self.cs.set_value(1)
+    def _send_command(self, cmd, *data):
+        """Send a command byte (DC=LOW) followed by its data bytes (DC=HIGH).
+
+        CS is held LOW across the command and its parameters, so a command
+        costs one CS cycle however many data bytes follow. DC idles HIGH.
+        """
+        fd = self._spi_fd
+        if self._dc_cs is not None:
+            self._dc_cs.set_values([0, 0])  # DC low, CS low
+            os.write(fd, bytes((cmd,)))
+            if data:
+                self._dc_cs.set_values([1, 0])
+                os.write(fd, bytes(data))
+            self._dc_cs.set_values([1, 1])
+        else:
+            self.dc.set_value(0)
+            os.write(fd, bytes((cmd,)))
+            self.dc.set_value(1)
+            if data:
+                os.write(fd, bytes(data))
 
     def _send_data_bulk(self, data):
         """Send bulk data (DC=HIGH, CS held LOW for entire transfer)."""
-        self.dc.set_value(1)
-        self.cs.set_value(0)
-        chunk_size = 4096
-        for i in range(0, len(data), chunk_size):
-            self.spi.writebytes(data[i:i + chunk_size])
-        self.cs.set_value(1)
-
-    def _set_window(self):
-        """Set the RAM window to full screen."""
-        self._send_command(0x44)  # RAM X address range
-        self._send_data(0x00)
-        self._send_data(0x31)
-
-        self._send_command(0x45)  # RAM Y address range
-        self._send_data(0x00)
-        self._send_data(0x00)
-        self._send_data(0x2B)
-        self._send_data(0x01)
-
-    def _set_cursor(self):
-        """Set the RAM cursor to (0, 0)."""
-        self._send_command(0x4E)
-        self._send_data(0x00)
-        self._send_command(0x4F)
-        self._send_data(0x00)
-        self._send_data(0x00)
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)  # one C conversion instead of per-int unboxing
+        if self._dc_cs is not None:
+            self._dc_cs.set_values([1, 0])
+        fd, step = self._spi_fd, self._spi_bufsiz
+        if len(data) <= step:
+            os.write(fd, data)
+        else:
+            mv = memoryview(data)
+            for i in range(0, len(mv), step):
+                os.write(fd, mv[i:i + step])
+        if self._dc_cs is not None:
+            self._dc_cs.set_values([1, 1])
+
+    def _set_window(self, x0=0, y0=0, x1=None, y1=None):
+        """Set the RAM window (X in bytes, Y in rows, inclusive). Default: full screen."""
+        if x1 is None:
+            x1 = self.width // 8 - 1
+        if y1 is None:
+            y1 = self.height - 1
+        self._send_command(0x44, x0, x1)                                  # RAM X address range
+        self._send_command(0x45, y0 & 0xFF, y0 >> 8, y1 & 0xFF, y1 >> 8)  # RAM Y address range
+
+    def _set_cursor(self, x=0, y=0):
+        """Set the RAM cursor (X in bytes, Y in rows). Default: (0, 0)."""
+        self._send_command(0x4E, x)
+        self._send_command(0x4F, y & 0xFF, y >> 8)
+
+    def _write_window(self, ram_cmd, buffer, window):
+        """Write the (x0, y0, x1, y1) window of a full-frame buffer to NEW/OLD RAM."""
+        x0, y0, x1, y1 = window
+        row = self.width // 8
+        if window == (0, 0, row - 1, self.height - 1):
+            data = buffer
+        else:
+            data = b"".join(buffer[y * row + x0:y * row + x1 + 1]
+                            for y in range(y0, y1 + 1))
+        self._write_ram(ram_cmd, data, window)
+
+    def _write_ram(self, ram_cmd, data, window):
+        """Write packed window data (row by row) to NEW/OLD RAM."""
+        x0, y0, x1, y1 = window
+        self._set_window(x0, y0, x1, y1)
+        self._set_cursor(x0, y0)
+        self._send_command(ram_cmd)
+        self._send_data_bulk(data)
+
+    def _dirty_window(self, old, new):
+        """Bounding box of the bytes that differ between two frames.
+
+        Returns (x0, y0, x1, y1), inclusive, in byte columns and rows, or None
+        if the frames are identical. Each row is XORed as one big int, so the
+        scan is a few hundred C-level operations, not a loop over every byte.
+        """
+        if old == new:
+            return None
+        row = self.width // 8
+        y0 = y1 = None
+        diff = 0
+        for y in range(self.height):
+            a = old[y * row:(y + 1) * row]
+            b = new[y * row:(y + 1) * row]
+            if a != b:
+                diff |= int.from_bytes(a, "big") ^ int.from_bytes(b, "big")
+                if y0 is None:
+                    y0 = y
+                y1 = y
+        # Highest set bit -> leftmost differing byte, lowest -> rightmost
+        x0 = row - 1 - (diff.bit_length() - 1) // 8
+        x1 = row - 1 - ((diff & -diff).bit_length() - 1) // 8
+        return x0, y0, x1, y1
+
+    def _count_erased(self, old, new, y0, y1):
+        """Count pixels that go black -> white between two frames in rows y0..y1.
+
+        Erased pixels are what leaves ghosting behind under partial refresh.
+        """
+        row = self.width // 8
+        start, end = y0 * row, (y1 + 1) * row
+        a = int.from_bytes(old[start:end], "big")
+        b = int.from_bytes(new[start:end], "big")
+        return bin((a ^ b) & b).count("1")  # bits that flipped to 1 (white)
 
     # --- Display operations ---
 
     def reset(self):
-        """Hardware reset the display."""
+        """Hardware reset the display (SSD1683 needs >=10ms low, 10ms settle)."""
         self.rst.set_value(0)
-        time.sleep(0.05)
+        time.sleep(0.01)
         self.rst.set_value(1)
-        time.sleep(0.05)
+        time.sleep(0.01)
         self._wait_busy()
 
     def init(self):
         """Initialize the display for a full refresh cycle."""
         self.reset()
 
-        self._send_command(0x12)  # SW Reset
-        time.sleep(0.1)
+        self._send_command(0x12)  # SW Reset (BUSY rises as soon as it latches)
         self._wait_busy()
 
-        self._send_command(0x21)  # Display Update Control
-        self._send_data(0x40)
-        self._send_data(0x00)
-
-        self._send_command(0x3C)  # Border Waveform
-        self._send_data(0x05)
-
-        self._send_command(0x11)  # Data Entry Mode: X-mode
-        self._send_data(0x03)
+        self._send_command(0x21, 0x40, 0x00)  # Display Update Control
+        self._send_command(0x3C, 0x05)        # Border Waveform
+        self._send_command(0x11, 0x03)        # Data Entry Mode: X-mode
 
         self._set_window()
         self._set_cursor()
@@ -195,86 +317,155 @@ class EPD42:
     def init_partial(self):
         """Initialize the display for partial refresh mode.
 
-        Call init() and display() first to set both RAM buffers,
-        then call init_partial() to switch to partial mode.
+        Call init() and display() first to set the base image, then call
+        init_partial() to switch to partial mode. OLD RAM is synced to the
+        base image on the first display_partial().
         """
         self.init()
 
-        self._send_command(0x3C)  # Border Waveform
-        self._send_data(0x80)
-
-        self._send_command(0x21)  # Display Update Control
-        self._send_data(0x00)    # RED normal
-        self._send_data(0x00)    # single chip application
+        self._send_command(0x3C, 0x80)        # Border Waveform
+        # Display Update Control: RED normal, single chip application
+        self._send_command(0x21, 0x00, 0x00)
 
         self._partial_count = 0
-        self._last_full_refresh = time.time()
+        self._last_full_refresh = time.monotonic()
 
     def display(self, buffer):
         """
         Write image buffer to display and perform full refresh.
 
+        Only NEW RAM is written: a full refresh bypasses OLD RAM (0x21 = 0x40),
+        so the OLD RAM copy partial refresh needs is deferred to the next
+        display_partial() and skipped entirely for full-refresh-only use.
+
         Args:
-            buffer: list/bytes of length (width/8 * height) = 15000.
+            buffer: bytes-like (bytes, bytearray, memoryview) or list of ints,
+                    length (width/8 * height) = 15000.
                     Each bit: 1=white, 0=black. MSB first.
         """
+        buffer = bytes(buffer)  # no-op for bytes; snapshots mutable buffers
+        self._set_window()  # a previous partial may have narrowed it
+        self._set_cursor()
         self._send_command(0x24)  # Write to NEW RAM
         self._send_data_bulk(buffer)
 
-        self._send_command(0x26)  # Write to OLD RAM
-        self._send_data_bulk(buffer)
-
-        self._send_command(0x22)  # Display Update Control
-        self._send_data(0xF7)
+        self._send_command(0x22, 0xF7)  # Display Update Control
         self._send_command(0x20)  # Activate Display Update Sequence
         self._wait_busy()
-        self._last_full_refresh = time.time()
+        self._last_full_refresh = time.monotonic()
         self._partial_count = 0
+        self._erased_pixels = 0
+        self._prev_buffer = buffer
+        self._old_ram_synced = False
 
     def display_partial(self, buffer):
         """
         Write image buffer and perform partial refresh (faster, slight ghosting).
 
         Must call init_partial() first. A full refresh is triggered automatically
-        every 5 minutes to clean ghosting. Can also be forced with full_refresh().
+        every 5 minutes, or once a frame's worth of pixels has been erased since
+        the last one, to clean ghosting. Can also be forced with full_refresh().
+
+        Only the bounding box of bytes that changed since the previous frame is
+        written to NEW and OLD RAM (the rest of RAM already holds the previous
+        frame), and an unchanged frame skips the refresh entirely. For a typed
+        character that is a few hundred bytes instead of 2 x 15000.
 
         Args:
-            buffer: list/bytes of length (width/8 * height) = 15000.
+            buffer: bytes-like or list of ints, length (width/8 * height) = 15000.
         """
+        buffer = bytes(buffer)  # no-op for bytes; snapshots mutable buffers
         self._partial_count += 1
 
         # Time-based full refresh to clean ghosting (every 5 min)
-        if time.time() - self._last_full_refresh >= self._full_refresh_interval:
+        if time.monotonic() - self._last_full_refresh >= self._full_refresh_interval:
             self.init()
             self.display(buffer)
             self.init_partial()
             return
 
-        self._send_command(0x3C)  # Border Waveform
-        self._send_data(0x80)
+        full = (0, 0, self.width // 8 - 1, self.height - 1)
+        prev = self._prev_buffer
+        if prev is None or len(prev) != len(buffer):
+            window = full
+        else:
+            window = self._dirty_window(prev, buffer)
+            if window is None:
+                return  # nothing changed on screen
 
-        self._send_command(0x21)  # Display Update Control
-        self._send_data(0x00)
-        self._send_data(0x00)
+            # Ghosting builds up with every erased pixel, not with time alone
+            self._erased_pixels += self._count_erased(prev, buffer, window[1], window[3])
+            if self._erased_pixels >= self._ghost_limit:
+                self.full_refresh(buffer)
+                return
 
-        self._set_window()
-        self._set_cursor()
+        self._send_command(0x3C, 0x80)        # Border Waveform
+        self._send_command(0x21, 0x00, 0x00)  # Display Update Control
 
-        self._send_command(0x24)  # Write to NEW RAM only
-        self._send_data_bulk(buffer)
+        # OLD RAM must hold the on-screen image; display() leaves this to us
+        if not self._old_ram_synced and prev is not None:
+            self._write_window(0x26, prev, full)
+
+        self._write_window(0x24, buffer, window)  # Write to NEW RAM only
 
-        self._send_command(0x22)  # Display Update Control: partial
-        self._send_data(0xFF)
+        self._send_command(0x22, 0xFF)  # Display Update Control: partial
         self._send_command(0x20)  # Activate Display Update Sequence
         self._wait_busy()
 
         # Sync OLD RAM for next partial
-        self._set_cursor()
-        self._send_command(0x26)
-        self._send_data_bulk(buffer)
+        self._write_window(0x26, buffer, window)
+        self._prev_buffer = buffer
+        self._old_ram_synced = True
+
+    def display_partial_region(self, buffer, x0, y0, x1, y1):
+        """
+        Partial-refresh a rectangle, sending only that rectangle's bytes.
+
+        The region is [x0, x1) x [y0, y1) in panel pixels; x0 and x1 must be
+        multiples of 8. Must call init_partial() first. When the full frame
+        on screen is known (after display() or display_partial()), the region
+        is merged into it and refreshed via display_partial(), which keeps
+        its bookkeeping and the 5-minute full refresh intact.
+
+        Args:
+            buffer: packed region data, (x1 - x0) // 8 bytes per row,
+                    (y1 - y0) rows, same bit layout as display().
+        """
+        if x0 % 8 or x1 % 8:
+            raise ValueError("x0 and x1 must be multiples of 8")
+        if not (0 <= x0 < x1 <= self.width and 0 <= y0 < y1 <= self.height):
+            raise ValueError(f"region ({x0}, {y0})-({x1}, {y1}) is off screen")
+        row_bytes = (x1 - x0) // 8
+        buffer = bytes(buffer)
+        if len(buffer) != row_bytes * (y1 - y0):
+            raise ValueError(f"expected {row_bytes * (y1 - y0)} bytes, got {len(buffer)}")
+
+        if self._prev_buffer is not None:
+            row = self.width // 8
+            frame = bytearray(self._prev_buffer)
+            for i in range(y1 - y0):
+                start = (y0 + i) * row + x0 // 8
+                frame[start:start + row_bytes] = buffer[i * row_bytes:(i + 1) * row_bytes]
+            self.display_partial(frame)
+            return
+
+        # Unknown frame: trust that OLD RAM matches the screen outside the region
+        window = (x0 // 8, y0, x1 // 8 - 1, y1 - 1)
+        self._partial_count += 1
+        self._send_command(0x3C, 0x80)        # Border Waveform
+        self._send_command(0x21, 0x00, 0x00)  # Display Update Control
+        self._write_ram(0x24, buffer, window)
+        self._send_command(0x22, 0xFF)  # Display Update Control: partial
+        self._send_command(0x20)  # Activate Display Update Sequence
+        self._wait_busy()
+        self._write_ram(0x26, buffer, window)
 
     def full_refresh(self, buffer):
-        """Force a full refresh to clean ghosting. Use when display looks messy."""
+        """Force a full refresh to clean ghosting. Use when display looks messy.
+
+        Args:
+            buffer: bytes-like or list of ints, as for display().
+        """
         self.init()
         self.display(buffer)
         self.init_partial()
@@ -286,49 +477,113 @@ class EPD42:
         Args:
             color: 0xFF for white (default), 0x00 for black.
         """
-        buf = [color] * (self.width // 8 * self.height)
+        buf = self._CLEAR_CACHE.get(color)
+        if buf is None:
+            buf = bytes((color,)) * (self.width // 8 * self.height)
+            self._CLEAR_CACHE[color] = buf
         self.display(buf)
 
     def sleep(self):
         """Put the display into deep sleep mode. Requires reset to wake."""
-        self._send_command(0x10)  # Deep Sleep Mode
-        self._send_data(0x01)
+        self._send_command(0x10, 0x01)  # Deep Sleep Mode
 
-    def display_image(self, image):
+    def display_image(self, image, threshold=None):
         """
         Display a PIL Image on the e-paper (full refresh).
 
         Args:
             image: PIL Image object. Will be converted to 1-bit, resized if needed.
+            threshold: see getbuffer().
         """
-        if image.size != (self.width, self.height):
-            image = image.resize((self.width, self.height))
-        image = image.convert("1")
-        buffer = list(image.tobytes())
-        self.display(buffer)
+        image = self._fit(image)
+        self.display(self.getbuffer(image, threshold))
 
-    def display_image_partial(self, image):
+    def display_image_partial(self, image, threshold=None):
         """
         Display a PIL Image using partial refresh (faster).
 
         Args:
             image: PIL Image object (400x300 or will be resized).
+            threshold: see getbuffer().
+        """
+        image = self._fit(image)
+        self.display_partial(self.getbuffer(image, threshold))
+
+    def submit_partial(self, image, threshold=None):
+        """
+        Queue a PIL Image for partial refresh on a background thread.
+
+        Buffer conversion, the SPI write and the BUSY wait all run on a single
+        worker thread, so the caller can keep working while the panel updates.
+        Frames are shown in submission order. Don't modify the image after
+        submitting it, and wait on the returned futures before calling the
+        synchronous display methods.
+
+        Returns:
+            concurrent.futures.Future, done when the refresh has finished.
+        """
+        return self._worker().submit(self.display_image_partial, image, threshold)
+
+    def display_async(self, buffer, sleep_after=False):
+        """
+        Full-refresh a buffer on the background worker and return immediately.
+
+        The SPI write and the multi-second BUSY wait (plus sleep() afterwards
+        when sleep_after is set) run on the same worker as submit_partial(),
+        so queued work runs in order and never interleaves on the bus.
+
+        Returns:
+            concurrent.futures.Future, done once the refresh (and sleep) has
+            finished; result() re-raises any error from the worker.
+        """
+        buffer = bytes(buffer)  # snapshot before the caller reuses it
+
+        def job():
+            self.display(buffer)
+            if sleep_after:
+                self.sleep()
+
+        return self._worker().submit(job)
+
+    def _worker(self):
+        """Single background thread shared by the async display methods."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="epd")
+        return self._executor
+
+    def _fit(self, image):
+        """Resize an image to the panel size if needed (nearest neighbour).
+
+        Pillow's default filter for RGB/L images is bicubic, which is wasted
+        work when the result is thresholded to 1 bit straight after.
         """
         if image.size != (self.width, self.height):
-            image = image.resize((self.width, self.height))
-        image = image.convert("1")
-        buffer = list(image.tobytes())
-        self.display_partial(buffer)
+            image = image.resize((self.width, self.height), Image.Resampling.NEAREST)
+        return image
 
     @staticmethod
-    def getbuffer(image):
+    def getbuffer(image, threshold=None):
         """
         Convert a PIL Image to display buffer (Waveshare-compatible).
 
         Args:
             image: PIL Image (mode "1", size 400x300).
+            threshold: if given, non-1-bit images are thresholded (pixels
+                       brighter than this become white) instead of dithered.
+                       Faster, and crisper for text and line art.
 
         Returns:
-            list of bytes for display().
+            bytes for display(). Mode "1" is already packed 8 px/byte, MSB first,
+            which is the SSD1683 RAM layout, so no bit reordering is needed.
         """
-        return list(image.convert("1").tobytes())
+        if image.mode != "1":
+            if threshold is None:
+                image = image.convert("1")  # Floyd-Steinberg dither
+            else:
+                if image.mode != "L":
+                    image = image.convert("L")
+                # One C pass: 256-entry lookup table straight to packed 1-bit
+                lut = [255 if p > threshold else 0 for p in range(256)]
+                image = image.point(lut, "1")
+        return image.tobytes()
@@ -18,6 +18,7 @@ apt-get install -y \
     python3-libgpiod \
     python3-pil \
     python3-evdev \
+    python3-pyudev \
     python3-dbus \
     python3-gi \
     dnsmasq \
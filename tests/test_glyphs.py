@@ -0,0 +1,40 @@
+"""Glyph tiles must reproduce PIL's own text rendering pixel for pixel."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# typewriter imports the panel driver, which needs the Pi's SPI/GPIO modules
+pytest.importorskip("spidev")
+pytest.importorskip("gpiod")
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+import typewriter  # noqa: E402
+from typewriter import MARGIN_X, PORTRAIT_H, PORTRAIT_W  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    app = typewriter.EtyperApp()
+    app.font = app._find_font()
+    app._calc_text_metrics()
+    return app
+
+
+@pytest.mark.parametrize("text", ["a__b", "hello, world!", "(x) [y] {z} gjy|@"])
+def test_draw_string_matches_draw_text(app, text):
+    ref = Image.new("1", (PORTRAIT_W, PORTRAIT_H), 255)
+    ImageDraw.Draw(ref).text((MARGIN_X, 40), text, font=app.font, fill=0)
+
+    img = Image.new("1", (PORTRAIT_H, PORTRAIT_W), 255)
+    app._draw_string(img, MARGIN_X, 40, text)
+
+    assert img.transpose(Image.Transpose.ROTATE_90).tobytes() == ref.tobytes()
+
+
+def test_only_single_characters_are_prerendered(app):
+    assert all(len(ch) == 1 and ch != " " for ch in app._glyphs)
@@ -28,13 +28,15 @@ import os
 import sys
 import ssl
 import time
+import queue
 import signal
 import select
-import textwrap
+import bisect
+import struct
 import subprocess
 import threading
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from urllib.parse import quote, unquote
 
 try:
@@ -56,6 +58,12 @@ DOCS_DIR = os.path.expanduser("~/etyper_docs")
 LAST_DOC_FILE = os.path.join(DOCS_DIR, ".last_doc")
 LAYOUT_CONFIG_FILE = os.path.join(DOCS_DIR, ".layout")
 AUTOSAVE_INTERVAL = 10  # seconds
+MAX_IDLE_WAIT = 2.0  # longest main-loop wait; bounds Ctrl+C/SIGTERM response
+
+# Raw evdev record (struct input_event): timeval, type, code, value
+EVENT_FMT = "llHHi"
+EVENT_SIZE = struct.calcsize(EVENT_FMT)
+EVENT_BATCH = 64  # events per read()
 
 # Portrait dimensions (display is 400x300, rotated 90 CCW)
 PORTRAIT_W = 300
@@ -83,6 +91,12 @@ try:
 except ImportError:
     HAS_EVDEV = False
 
+try:
+    import pyudev
+    HAS_PYUDEV = True
+except ImportError:
+    HAS_PYUDEV = False
+
 # Keyboard layouts: name -> {keycode: (normal, shifted)}
 LAYOUTS = {}
 LAYOUT_NAMES = []
@@ -111,8 +125,7 @@ if HAS_EVDEV:
         ecodes.KEY_SPACE: (" ", " "), ecodes.KEY_TAB: ("    ", "    "),
     }
 
-    LAYOUTS["UK QWERTY"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["UK QWERTY"] = LAYOUTS["US QWERTY"] | {
         ecodes.KEY_2: ("2", '"'),
         ecodes.KEY_3: ("3", "\u00a3"),   # £
         ecodes.KEY_APOSTROPHE: ("'", "@"),
@@ -120,8 +133,7 @@ if HAS_EVDEV:
         ecodes.KEY_GRAVE: ("`", "\u00ac"),  # ¬
     }
 
-    LAYOUTS["DE QWERTZ"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["DE QWERTZ"] = LAYOUTS["US QWERTY"] | {
         # Y and Z are swapped on German keyboards
         ecodes.KEY_Y: ("z", "Z"),
         ecodes.KEY_Z: ("y", "Y"),
@@ -213,8 +225,7 @@ if HAS_EVDEV:
     }
 
     # ES QWERTY — Spanish, adds ñ and rearranges some symbols
-    LAYOUTS["ES QWERTY"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["ES QWERTY"] = LAYOUTS["US QWERTY"] | {
         ecodes.KEY_2: ("2", '"'),
         ecodes.KEY_3: ("3", "\u00b7"),     # · middle dot
         ecodes.KEY_6: ("6", "&"),
@@ -236,8 +247,7 @@ if HAS_EVDEV:
     }
 
     # SE QWERTY — Swedish/Finnish, adds å ä ö
-    LAYOUTS["SE QWERTY"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["SE QWERTY"] = LAYOUTS["US QWERTY"] | {
         ecodes.KEY_LEFTBRACE: ("\u00e5", "\u00c5"),   # å Å
         ecodes.KEY_SEMICOLON: ("\u00f6", "\u00d6"),   # ö Ö
         ecodes.KEY_APOSTROPHE: ("\u00e4", "\u00c4"),  # ä Ä
@@ -252,8 +262,7 @@ if HAS_EVDEV:
     }
 
     # NO/DK QWERTY — Norwegian/Danish, adds å æ ø
-    LAYOUTS["NO/DK QWERTY"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["NO/DK QWERTY"] = LAYOUTS["US QWERTY"] | {
         ecodes.KEY_LEFTBRACE: ("\u00e5", "\u00c5"),   # å Å
         ecodes.KEY_SEMICOLON: ("\u00f8", "\u00d8"),   # ø Ø
         ecodes.KEY_APOSTROPHE: ("\u00e6", "\u00c6"),  # æ Æ
@@ -268,8 +277,7 @@ if HAS_EVDEV:
     }
 
     # IT QWERTY — Italian, adds à è é ì ò ù
-    LAYOUTS["IT QWERTY"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["IT QWERTY"] = LAYOUTS["US QWERTY"] | {
         ecodes.KEY_2: ("2", '"'),
         ecodes.KEY_3: ("3", "\u00a3"),             # £
         ecodes.KEY_6: ("6", "&"),
@@ -292,8 +300,7 @@ if HAS_EVDEV:
 
     # Colemak — popular ergonomic layout, great for prose writing
     # Only 17 keys differ from QWERTY; hands stay on home row much more
-    LAYOUTS["Colemak"] = {
-        **LAYOUTS["US QWERTY"],
+    LAYOUTS["Colemak"] = LAYOUTS["US QWERTY"] | {
         ecodes.KEY_E: ("f", "F"),    ecodes.KEY_R: ("p", "P"),
         ecodes.KEY_T: ("g", "G"),    ecodes.KEY_Y: ("j", "J"),
         ecodes.KEY_U: ("l", "L"),    ecodes.KEY_I: ("u", "U"),
@@ -307,8 +314,94 @@ if HAS_EVDEV:
 
     LAYOUT_NAMES = list(LAYOUTS.keys())
 
+    MODIFIER_KEYS = (ecodes.KEY_LEFTSHIFT, ecodes.KEY_RIGHTSHIFT,
+                     ecodes.KEY_LEFTCTRL, ecodes.KEY_RIGHTCTRL)
+
+
+def _keymap_table(layout):
+    """Flatten a layout dict into (normal, shifted) lists indexed by keycode.
+
+    Unmapped keys are None. Indexing the pair with the shift state picks
+    the list, so a keypress costs two list lookups.
+    """
+    normal = [None] * (ecodes.KEY_MAX + 1)
+    shifted = [None] * (ecodes.KEY_MAX + 1)
+    for code, (lower, upper) in layout.items():
+        normal[code] = lower
+        shifted[code] = upper
+    return normal, shifted
+
+
+# Keycode-indexed lookup tables, built once per layout
+KEYMAP_TABLES = {name: _keymap_table(layout) for name, layout in LAYOUTS.items()}
+
 # Default/fallback keymap (US QWERTY)
-KEYMAP = LAYOUTS.get("US QWERTY", {})
+KEYMAP = KEYMAP_TABLES.get("US QWERTY", ([], []))
+
+
+class _EditBuffer:
+    """Document text stored as a list of paragraphs (split on "\n").
+
+    An edit only rebuilds the paragraph(s) it touches instead of copying
+    the whole document, and paragraph start offsets are kept so a text
+    index maps to its paragraph with a bisect.
+    """
+
+    def __init__(self, text=""):
+        self.paragraphs = text.split("\n")
+        self.para_starts = [0]
+        for para in self.paragraphs[:-1]:
+            self.para_starts.append(self.para_starts[-1] + len(para) + 1)
+        self._len = len(text)
+        self._str = text  # joined text, rebuilt lazily after an edit
+
+    def __len__(self):
+        return self._len
+
+    def as_str(self):
+        """Return the whole document as one string."""
+        if self._str is None:
+            self._str = "\n".join(self.paragraphs)
+        return self._str
+
+    def para_index(self, pos):
+        """Return the index of the paragraph containing text index pos."""
+        return bisect.bisect_right(self.para_starts, pos) - 1
+
+    def replace(self, start, end, new):
+        """Replace the text between start and end with new.
+
+        Returns:
+            (first, removed, added): paragraphs first..first+removed-1 were
+            replaced by added new paragraphs starting at first.
+        """
+        starts = self.para_starts
+        p0 = self.para_index(start)
+        p1 = self.para_index(end)
+        delta = len(new) - (end - start)
+        self._len += delta
+        self._str = None
+
+        if p0 == p1 and "\n" not in new:
+            # Typing/erasing inside one paragraph: no paragraphs added or removed
+            para = self.paragraphs[p0]
+            base = starts[p0]
+            self.paragraphs[p0] = para[:start - base] + new + para[end - base:]
+            if delta:
+                starts[p0 + 1:] = [pos + delta for pos in starts[p0 + 1:]]
+            return p0, 1, 1
+
+        merged = (self.paragraphs[p0][:start - starts[p0]] + new
+                  + self.paragraphs[p1][end - starts[p1]:])
+        new_paras = merged.split("\n")
+        self.paragraphs[p0:p1 + 1] = new_paras
+
+        # Offsets of the new paragraphs, then shift everything after them
+        new_starts = [starts[p0]]
+        for para in new_paras[:-1]:
+            new_starts.append(new_starts[-1] + len(para) + 1)
+        starts[p0:] = new_starts + [pos + delta for pos in starts[p1 + 1:]]
+        return p0, p1 - p0 + 1, len(new_paras)
 
 
 if HAS_DBUS:
@@ -356,26 +449,42 @@ class EtyperApp:
     """Main typewriter application with cursor movement."""
 
     def __init__(self):
-        self.text = ""
+        self.text = _EditBuffer()
         self.cursor = 0  # character index in self.text
         self.doc_path = None
         self.running = False
         self.dirty = False
-        self.last_save_time = time.time()
+        self._edit_rev = 0  # bumped on every text change
+        self._saved_rev = -1  # _edit_rev last written to doc_path
+        self.last_save_time = time.monotonic()
         self.epd = None
+        self._frame_q = queue.Queue(maxsize=1)  # newest frame awaiting refresh
+        self._display_thread = None
         self.keyboard = None
+        self._udev_monitor = None  # pyudev monitor for input hotplug
         self.font = None
+        self._glyphs = {}  # char -> (dx, dy, rotated 1-bit mask) or None
+        self._status_cache = None  # ((doc_path, dirty), position, strip image)
+        self._page_cache = None  # (render key, frame without the cursor)
+        self._server_screen = None  # file server instructions frame bytes
         self.shift_held = False
         self.ctrl_held = False
         self.active_layout = "US QWERTY"
         self.keymap = KEYMAP
+        self._layout_on_disk = None  # contents of LAYOUT_CONFIG_FILE
+        self._last_doc = None  # contents of LAST_DOC_FILE, None until read
         self.chars_per_line = 30
         self.lines_per_page = 20
         self.needs_display_update = True
         self.scroll_offset = 0  # first visible wrapped-line index
+        self._lines = [""]  # all wrapped lines, flattened
+        self._line_starts = [0]  # text index where each wrapped line begins
+        self._wrap_cpl = None  # chars_per_line the wrap was computed for
         self._bt_agent = None  # reusable D-Bus BT agent
         self._bt_bus = None  # reusable D-Bus system bus
         self._dbus_mainloop_set = False  # ensure mainloop set only once
+        self._glib_loop = None  # GLib loop dispatching D-Bus calls, started once
+        self._bt_bridge_up = False  # PAN bridge configured by us and kept between sessions
 
     def _find_font(self):
         """Find a suitable monospace font."""
@@ -398,6 +507,62 @@ class EtyperApp:
         self.chars_per_line = max(1, usable_w // char_w)
         self.lines_per_page = max(1, usable_h // self.line_h) - 1  # reserve status bar
 
+        # Pre-render every single character the layouts can type (not the
+        # TAB string or empty entries, which are never drawn as one cell)
+        self._glyphs = {}
+        for layout in LAYOUTS.values():
+            for pair in layout.values():
+                for ch in pair:
+                    if len(ch) == 1 and ch != " ":
+                        self._glyph(ch)
+
+    def _glyph(self, ch):
+        """Return (dx, dy, tile) for ch, rendering it on first use.
+
+        The tile is the 1-bit mask of the glyph's ink, which may reach
+        outside its monospace cell (e.g. "_" or accents); (dx, dy) is the
+        portrait offset of that ink box from the cell's top-left. Tiles are
+        stored already rotated into the landscape panel frame. Characters
+        without ink map to None.
+        """
+        if ch in self._glyphs:
+            return self._glyphs[ch]
+
+        # Pillow positions a lone glyph by its own ink box, which puts thin
+        # marks like "_" a pixel off from where draw.text puts them in running
+        # text. Drawing ch two cells after an "M" gives the in-line position;
+        # the space between keeps their ink apart.
+        x0, y0, x1, y1 = self.font.getbbox("M " + ch, mode="1")
+        canvas = Image.new("1", (x1 - x0, y1 - y0), 0)
+        ImageDraw.Draw(canvas).text((-x0, -y0), "M " + ch, font=self.font, fill=1)
+        canvas.paste(0, (0, 0, self.char_w - x0, canvas.height))  # drop the "M"
+        box = canvas.getbbox()
+        glyph = None
+        if box is not None:
+            tile = canvas.crop(box).transpose(Image.Transpose.ROTATE_270)
+            glyph = (box[0] + x0 - 2 * self.char_w, box[1] + y0, tile)
+        self._glyphs[ch] = glyph
+        return glyph
+
+    def _draw_string(self, img, x, y, s, fill=0):
+        """Blit s onto the landscape frame img one monospace cell at a time.
+
+        x, y are portrait coordinates of the top-left of the first cell.
+        """
+        for ch in s:
+            if ch != " ":
+                glyph = self._glyph(ch)
+                if glyph is not None:
+                    dx, dy, tile = glyph
+                    # Portrait box top-left (x+dx, y+dy) in landscape coordinates
+                    img.paste(fill, (PORTRAIT_H - y - dy - tile.width, x + dx), tile)
+            x += self.char_w
+
+    @staticmethod
+    def _landscape_box(x0, y0, x1, y1):
+        """Map an inclusive portrait box to landscape panel coordinates."""
+        return [PORTRAIT_H - 1 - y1, x0, PORTRAIT_H - 1 - y0, x1]
+
     def _find_keyboard(self):
         """Find a USB keyboard device via evdev."""
         if not HAS_EVDEV:
@@ -415,26 +580,71 @@ class EtyperApp:
         print("WARNING: No keyboard found. Waiting for connection...")
         return None
 
+    def _wait_for_keyboard(self, timeout=1.0):
+        """Probe for a keyboard, waiting up to timeout seconds if there is none.
+
+        With pyudev the wait ends as soon as an input device is added, so a
+        keyboard plugged in mid-wait is picked up at once; otherwise this
+        sleeps and the caller polls again.
+
+        Returns:
+            the keyboard (also stored in self.keyboard), or None.
+        """
+        self.keyboard = self._find_keyboard()
+        if self.keyboard is not None:
+            return self.keyboard
+
+        if HAS_PYUDEV and self._udev_monitor is None:
+            try:
+                monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+                monitor.filter_by("input")
+                monitor.start()
+                self._udev_monitor = monitor
+            except Exception as e:
+                print(f"udev monitor unavailable, polling instead: {e}")
+
+        if self._udev_monitor is None:
+            time.sleep(timeout)
+            return None
+
+        r, _, _ = select.select([self._udev_monitor], [], [], timeout)
+        if r:
+            while self._udev_monitor.poll(timeout=0) is not None:
+                pass  # drain the burst of add events for one device
+            self.keyboard = self._find_keyboard()
+        return self.keyboard
+
     # --- Layout management ---
 
     def _load_layout_pref(self):
         """Load saved keyboard layout preference from disk."""
         self._ensure_docs_dir()
-        if os.path.exists(LAYOUT_CONFIG_FILE):
-            name = open(LAYOUT_CONFIG_FILE).read().strip()
-            if name in LAYOUTS:
-                self.active_layout = name
-                self.keymap = LAYOUTS[name]
-                print(f"Layout: {name}")
-                return
+        name = self._layout_on_disk = self._read_pref(LAYOUT_CONFIG_FILE)
+        if name in LAYOUTS:
+            self.active_layout = name
+            self.keymap = KEYMAP_TABLES[name]
+            print(f"Layout: {name}")
+            return
         self.active_layout = "US QWERTY"
-        self.keymap = LAYOUTS.get("US QWERTY", KEYMAP)
+        self.keymap = KEYMAP
 
     def _save_layout_pref(self):
         """Save current keyboard layout preference to disk."""
+        if self.active_layout == self._layout_on_disk:
+            return  # unchanged; skip the SD card write
         self._ensure_docs_dir()
         with open(LAYOUT_CONFIG_FILE, "w") as f:
             f.write(self.active_layout)
+        self._layout_on_disk = self.active_layout
+
+    @staticmethod
+    def _read_pref(path):
+        """Return the stripped contents of a small pref file, or "" if missing."""
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return ""
 
     def _show_layout_picker(self):
         """Show a full-screen layout picker on the e-paper display.
@@ -444,77 +654,81 @@ class EtyperApp:
         if not LAYOUT_NAMES:
             return
 
+        self._flush_display()
         selected = LAYOUT_NAMES.index(self.active_layout) if self.active_layout in LAYOUT_NAMES else 0
 
-        def render_picker(sel_idx):
-            img = Image.new("1", (PORTRAIT_W, PORTRAIT_H), 255)
-            draw = ImageDraw.Draw(img)
-
-            title = "-- Keyboard Layout --"
-            tw = int(self.font.getlength(title))
-            draw.text(((PORTRAIT_W - tw) // 2, MARGIN_Y + 4), title, font=self.font, fill=0)
-            draw.line([(MARGIN_X, MARGIN_Y + self.line_h + 6),
-                       (PORTRAIT_W - MARGIN_X, MARGIN_Y + self.line_h + 6)], fill=0)
-
-            y = MARGIN_Y + self.line_h + 14
-            for i, name in enumerate(LAYOUT_NAMES):
-                label = f"> {name}" if i == sel_idx else f"  {name}"
-                if i == sel_idx:
-                    draw.rectangle(
-                        [MARGIN_X - 2, y - 1,
-                         PORTRAIT_W - MARGIN_X + 2, y + self.cell_h],
-                        fill=0,
-                    )
-                    draw.text((MARGIN_X + 2, y), label, font=self.font, fill=1)
-                else:
-                    draw.text((MARGIN_X + 2, y), label, font=self.font, fill=0)
-                y += self.line_h + 4
-
-            hint = "Enter=select  Esc=cancel"
-            hw = int(self.font.getlength(hint))
-            hy = PORTRAIT_H - MARGIN_Y - self.cell_h - 2
-            draw.line([(MARGIN_X, hy - 2), (PORTRAIT_W - MARGIN_X, hy - 2)], fill=0)
-            draw.text(((PORTRAIT_W - hw) // 2, hy), hint, font=self.font, fill=0)
+        # Everything except the highlight is drawn once per picker session
+        row_y0 = MARGIN_Y + self.line_h + 14
+        row_step = self.line_h + 4
+        baseline = Image.new("1", (PORTRAIT_W, PORTRAIT_H), 255)
+        draw = ImageDraw.Draw(baseline)
+
+        title = "-- Keyboard Layout --"
+        tw = self.char_w * len(title)
+        draw.text(((PORTRAIT_W - tw) // 2, MARGIN_Y + 4), title, font=self.font, fill=0)
+        draw.line([(MARGIN_X, MARGIN_Y + self.line_h + 6),
+                   (PORTRAIT_W - MARGIN_X, MARGIN_Y + self.line_h + 6)], fill=0)
+
+        for i, name in enumerate(LAYOUT_NAMES):
+            draw.text((MARGIN_X + 2, row_y0 + i * row_step), f"  {name}",
+                      font=self.font, fill=0)
+
+        hint = "Enter=select  Esc=cancel"
+        hw = self.char_w * len(hint)
+        hy = PORTRAIT_H - MARGIN_Y - self.cell_h - 2
+        draw.line([(MARGIN_X, hy - 2), (PORTRAIT_W - MARGIN_X, hy - 2)], fill=0)
+        draw.text(((PORTRAIT_W - hw) // 2, hy), hint, font=self.font, fill=0)
+        baseline = baseline.transpose(Image.Transpose.ROTATE_270)
 
-            return img.transpose(Image.Transpose.ROTATE_270)
+        def render_picker(sel_idx):
+            # Highlight bar covers the plain label drawn in the baseline. It
+            # is drawn upright and only this strip is rotated, not the frame.
+            x0, x1 = MARGIN_X - 2, PORTRAIT_W - MARGIN_X + 2
+            y = row_y0 + sel_idx * row_step
+            bar = Image.new("1", (x1 - x0 + 1, self.cell_h + 2), 0)
+            ImageDraw.Draw(bar).text((MARGIN_X + 2 - x0, 1),
+                                     f"> {LAYOUT_NAMES[sel_idx]}",
+                                     font=self.font, fill=1)
+
+            img = baseline.copy()
+            box = self._landscape_box(x0, y - 1, x1, y + self.cell_h)
+            img.paste(bar.transpose(Image.Transpose.ROTATE_270), (box[0], box[1]))
+            return img
 
         # Show picker with full refresh
         self.epd.init()
-        self.epd.display(list(render_picker(selected).tobytes()))
+        self.epd.display(render_picker(selected).tobytes())
         self.epd.init_partial()
 
         # Input loop
         ctrl_held = False
         while self.running:
             if self.keyboard is None:
-                self.keyboard = self._find_keyboard()
-                if self.keyboard is None:
-                    time.sleep(1)
+                if self._wait_for_keyboard() is None:
                     continue
             try:
                 r, _, _ = select.select([self.keyboard.fd], [], [], 1.0)
                 if not r:
                     continue
-                for event in self.keyboard.read():
-                    if event.type != ecodes.EV_KEY or event.value == 0:
+                # Apply every queued key first, then redraw once
+                start = selected
+                for code, value in self._read_key_events():
+                    if value == 0:
                         continue
-                    code = event.code
 
                     if code in (ecodes.KEY_LEFTCTRL, ecodes.KEY_RIGHTCTRL):
-                        ctrl_held = event.value != 0
+                        ctrl_held = value != 0
                         continue
 
                     if code == ecodes.KEY_UP:
                         selected = (selected - 1) % len(LAYOUT_NAMES)
-                        self.epd.display_image_partial(render_picker(selected))
 
                     elif code == ecodes.KEY_DOWN:
                         selected = (selected + 1) % len(LAYOUT_NAMES)
-                        self.epd.display_image_partial(render_picker(selected))
 
                     elif code == ecodes.KEY_ENTER:
                         self.active_layout = LAYOUT_NAMES[selected]
-                        self.keymap = LAYOUTS[self.active_layout]
+                        self.keymap = KEYMAP_TABLES[self.active_layout]
                         self._save_layout_pref()
                         print(f"Layout changed to: {self.active_layout}")
                         self._resume_typewriter_display()
@@ -525,6 +739,9 @@ class EtyperApp:
                         self._resume_typewriter_display()
                         return
 
+                if selected != start:
+                    self.epd.display_image_partial(render_picker(selected))
+
             except OSError:
                 self.keyboard = None
                 time.sleep(1)
@@ -535,15 +752,19 @@ class EtyperApp:
         os.makedirs(DOCS_DIR, exist_ok=True)
 
     def _get_last_doc_path(self):
-        if os.path.exists(LAST_DOC_FILE):
-            path = open(LAST_DOC_FILE).read().strip()
-            if os.path.exists(path):
-                return path
+        if self._last_doc is None:
+            self._last_doc = self._read_pref(LAST_DOC_FILE)  # read once per run
+        path = self._last_doc
+        if path and os.path.exists(path):
+            return path
         return None
 
     def _set_last_doc(self, path):
+        if path == self._last_doc:
+            return  # unchanged; skip the SD card write
         with open(LAST_DOC_FILE, "w") as f:
             f.write(path)
+        self._last_doc = path
 
     def _new_doc_path(self):
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -559,11 +780,12 @@ class EtyperApp:
 
         if self.doc_path and os.path.exists(self.doc_path):
             with open(self.doc_path, "r") as f:
-                self.text = f.read()
+                self._set_text(f.read())
+            self._saved_rev = self._edit_rev  # matches the file on disk
             print(f"Opened: {self.doc_path}")
         else:
             self.doc_path = self._new_doc_path()
-            self.text = ""
+            self._set_text("")
             print(f"New document: {self.doc_path}")
 
         self.cursor = len(self.text)  # cursor at end
@@ -572,15 +794,33 @@ class EtyperApp:
 
     def save_document(self):
         if self.doc_path:
-            with open(self.doc_path, "w") as f:
-                f.write(self.text)
+            if self._edit_rev != self._saved_rev:
+                # Write a temp file and rename it over the document so a
+                # power cut mid-save leaves either the old or the new text
+                tmp = self.doc_path + ".tmp"
+                with open(tmp, "w") as f:
+                    try:  # keep any mode the user gave the document
+                        os.fchmod(f.fileno(), os.stat(self.doc_path).st_mode & 0o7777)
+                    except FileNotFoundError:
+                        pass
+                    f.write(self.text.as_str())
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.doc_path)
+                # The rename only survives a power cut once the directory is synced
+                dir_fd = os.open(os.path.dirname(self.doc_path) or ".", os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+                self._saved_rev = self._edit_rev
             self.dirty = False
-            self.last_save_time = time.time()
+            self.last_save_time = time.monotonic()
 
     def new_document(self):
         self.save_document()
         self.doc_path = self._new_doc_path()
-        self.text = ""
+        self._set_text("")
         self.cursor = 0
         self.scroll_offset = 0
         self._set_last_doc(self.doc_path)
@@ -619,6 +859,125 @@ class EtyperApp:
 
     # --- Text wrapping with cursor tracking ---
 
+    def _set_text(self, text):
+        """Replace the whole document and re-wrap every paragraph."""
+        self.text = _EditBuffer(text)
+        self._edit_rev += 1
+        self._wrap_cpl = None
+
+    def _replace_text(self, start, end, new):
+        """Replace the text between start and end with new, re-wrapping
+        only the paragraphs the edit touches."""
+        buf = self.text
+        self._edit_rev += 1
+        if self._wrap_cpl != self.chars_per_line:
+            buf.replace(start, end, new)
+            return  # full re-wrap pending anyway
+
+        # Wrapped lines currently belonging to the paragraphs being edited
+        line_starts = self._line_starts
+        p1 = buf.para_index(end)
+        line0 = bisect.bisect_left(line_starts, buf.para_starts[buf.para_index(start)])
+        if p1 + 1 < len(buf.para_starts):
+            line1 = bisect.bisect_left(line_starts, buf.para_starts[p1 + 1])
+        else:
+            line1 = len(line_starts)
+
+        first, removed, added = buf.replace(start, end, new)
+        if removed == added == 1:
+            self._rewrap_edit(first, start, end, len(new), line0, line1)
+            return
+
+        # Splice in the re-wrapped paragraphs and shift the lines after them
+        new_lines = []
+        new_starts = []
+        for p in range(first, first + added):
+            self._wrap_into(buf.paragraphs[p], buf.para_starts[p],
+                            new_lines, new_starts)
+        delta = len(new) - (end - start)
+        self._lines[line0:line1] = new_lines
+        line_starts[line0:] = new_starts + [pos + delta for pos in line_starts[line1:]]
+
+    def _rewrap_edit(self, p, start, end, new_len, line0, line1):
+        """Re-wrap paragraph p after text start..end inside it became new_len
+        characters long; its lines were line0..line1-1 before the edit.
+
+        Greedy wrapping can only pull text from the edited line back onto the
+        line before it, so wrapping resumes there. It stops at the first new
+        line past the edit that starts where an old line did: from there on
+        the old lines are still right, just shifted. Typing at the end of a
+        long paragraph therefore re-wraps one or two lines, not all of it.
+        """
+        lines = self._lines
+        line_starts = self._line_starts
+        para = self.text.paragraphs[p]
+        base = self.text.para_starts[p]
+        delta = new_len - (end - start)
+
+        first = max(line0, bisect.bisect_right(line_starts, start, line0, line1) - 2)
+        new_lines = []
+        new_starts = []
+        old = first  # next old line that could still line up
+        for s, e in self._wrap_para(para, self.chars_per_line, line_starts[first] - base):
+            pos = base + s
+            if pos >= start + new_len:
+                while old < line1 and line_starts[old] + delta < pos:
+                    old += 1
+                if (old < line1 and line_starts[old] >= end
+                        and line_starts[old] + delta == pos):
+                    break  # back in step with the old wrap
+            new_lines.append(para[s:e])
+            new_starts.append(pos)
+        else:
+            old = line1
+
+        lines[first:old] = new_lines
+        line_starts[first:] = new_starts + [pos + delta for pos in line_starts[old:]]
+
+    def _wrap_into(self, para, para_start, lines, line_starts):
+        """Wrap one paragraph, appending its lines and their text offsets."""
+        if len(para) <= self.chars_per_line:
+            lines.append(para)
+            line_starts.append(para_start)
+            return
+        for start, end in self._wrap_para(para, self.chars_per_line):
+            lines.append(para[start:end])
+            line_starts.append(para_start + start)
+
+    @staticmethod
+    def _wrap_para(para, cpl, i=0):
+        """Word-wrap a single paragraph, yielding the (start, end) span of
+        each line from offset i (a line start) on.
+
+        Greedy monospace wrap: break at the last space that fits, which is
+        consumed by the break; words longer than cpl are split hard. Every
+        other character, including runs of spaces, stays on its line, so
+        each text index maps to exactly one (line, col). Always yields at
+        least one span.
+        """
+        n = len(para)
+        while n - i > cpl:
+            k = para.rfind(" ", i + 1, i + cpl + 1)
+            if k == -1:
+                yield i, i + cpl
+                i += cpl
+            else:
+                yield i, k
+                i = k + 1
+        yield i, n
+
+    def _layout(self):
+        """Return the wrapped lines, re-wrapping everything only when the
+        whole document or chars_per_line changed."""
+        if self._wrap_cpl != self.chars_per_line:
+            self._lines = []
+            self._line_starts = []
+            buf = self.text
+            for para, para_start in zip(buf.paragraphs, buf.para_starts):
+                self._wrap_into(para, para_start, self._lines, self._line_starts)
+            self._wrap_cpl = self.chars_per_line
+        return self._lines
+
     def _wrap_with_cursor(self):
         """Word-wrap text and track which wrapped line/column the cursor is on.
 
@@ -627,81 +986,20 @@ class EtyperApp:
             cursor_line is the 0-based index into lines, cursor_col is the
             character offset within that line.
         """
-        cpl = self.chars_per_line
-        lines = []
-        char_to_pos = {}
-        text = self.text
-
-        line_idx = 0
-        para_start = 0
-        paragraphs = text.split("\n")
-
-        for p_idx, para in enumerate(paragraphs):
-            if para == "":
-                lines.append("")
-                # Map the \n after this empty paragraph to start of this line
-                if p_idx < len(paragraphs) - 1:
-                    char_to_pos[para_start] = (line_idx, 0)
-                line_idx += 1
-                para_start += 1  # empty string + \n
-                continue
-
-            # Wrap this paragraph
-            wrapped = textwrap.wrap(para, width=cpl,
-                                    break_long_words=True,
-                                    break_on_hyphens=False)
-            if not wrapped:
-                wrapped = [""]
-
-            # Map character positions within paragraph to wrapped lines
-            para_char = 0
-            for w_line in wrapped:
-                for col, ch in enumerate(w_line):
-                    char_to_pos[para_start + para_char] = (line_idx, col)
-                    para_char += 1
-                # Account for the space that was consumed by wrapping
-                if para_char < len(para) and para[para_char] == " ":
-                    char_to_pos[para_start + para_char] = (line_idx, len(w_line))
-                    para_char += 1
-                lines.append(w_line)
-                line_idx += 1
-
-            # Map the \n that ends this paragraph (cursor at \n = end of line)
-            if p_idx < len(paragraphs) - 1:
-                newline_pos = para_start + len(para)
-                char_to_pos[newline_pos] = (line_idx - 1, len(lines[-1]))
-
-            para_start += len(para) + 1  # +1 for \n
-
-        # Handle empty document
-        if not lines:
-            lines = [""]
-
-        # Find cursor position
-        if self.cursor >= len(text):
-            # Cursor at end of text
-            if lines:
-                cursor_line = len(lines) - 1
-                cursor_col = len(lines[-1])
-            else:
-                cursor_line = 0
-                cursor_col = 0
-        elif self.cursor in char_to_pos:
-            cursor_line, cursor_col = char_to_pos[self.cursor]
-        else:
-            # Fallback: cursor at end
-            cursor_line = len(lines) - 1
-            cursor_col = len(lines[-1])
-
-        return lines, cursor_line, cursor_col
+        lines = self._layout()
+        line = bisect.bisect_right(self._line_starts, self.cursor) - 1
+        return lines, line, self.cursor - self._line_starts[line]
 
     # --- Rendering ---
 
     def render(self):
-        """Render the current text to a PIL Image in portrait orientation."""
-        img = Image.new("1", (PORTRAIT_W, PORTRAIT_H), 255)
-        draw = ImageDraw.Draw(img)
+        """Render the current text to a PIL Image in panel (landscape) orientation.
 
+        Layout is computed in portrait coordinates and drawn straight into
+        the landscape frame, so the result can go to the panel as-is. The
+        page without the cursor is kept until the text, scroll position or
+        status changes, so cursor movement only redraws the cursor cell.
+        """
         lines, cursor_line, cursor_col = self._wrap_with_cursor()
 
         visible = self.lines_per_page
@@ -712,13 +1010,23 @@ class EtyperApp:
         elif cursor_line >= self.scroll_offset + visible:
             self.scroll_offset = cursor_line - visible + 1
 
-        display_lines = lines[self.scroll_offset:self.scroll_offset + visible]
+        key = (self._edit_rev, self.scroll_offset, self.doc_path, self.dirty)
+        if self._page_cache is None or self._page_cache[0] != key:
+            page = Image.new("1", (PORTRAIT_H, PORTRAIT_W), 255)
 
-        # Draw text lines
-        y = MARGIN_Y
-        for line in display_lines:
-            draw.text((MARGIN_X, y), line, font=self.font, fill=0)
-            y += self.line_h
+            # Draw text lines
+            y = MARGIN_Y
+            for line in lines[self.scroll_offset:self.scroll_offset + visible]:
+                self._draw_string(page, MARGIN_X, y, line)
+                y += self.line_h
+
+            # Status bar
+            pos, strip = self._status_strip()
+            page.paste(strip, pos)
+            self._page_cache = (key, page)
+
+        img = self._page_cache[1].copy()
+        draw = ImageDraw.Draw(img)
 
         # Draw cursor block (full cell height to cover ascenders and descenders)
         vis_cursor_line = cursor_line - self.scroll_offset
@@ -727,90 +1035,73 @@ class EtyperApp:
             cy = MARGIN_Y + vis_cursor_line * self.line_h
 
             if cx + self.char_w <= PORTRAIT_W - MARGIN_X:
-                draw.rectangle(
-                    [cx, cy, cx + self.char_w - 1, cy + self.cell_h - 1],
-                    fill=0
-                )
-                # Draw the character under cursor in white (inverted)
+                x0, y0, x1, y1 = self._landscape_box(cx, cy, cx + self.char_w - 1,
+                                                     cy + self.cell_h - 1)
+                draw.rectangle([x0, y0, x1, y1], fill=0)
+                # Draw the character under cursor in white (inverted), on a
+                # copy of the block so ink overhanging the cell can't erase
+                # the neighbours; portrait (0, PORTRAIT_H - cell_h) is the
+                # block's top-left in its own landscape frame
                 if cursor_line < len(lines) and cursor_col < len(lines[cursor_line]):
-                    ch = lines[cursor_line][cursor_col]
-                    draw.text((cx, cy), ch, font=self.font, fill=1)
+                    block = img.crop((x0, y0, x1 + 1, y1 + 1))
+                    self._draw_string(block, 0, PORTRAIT_H - self.cell_h,
+                                      lines[cursor_line][cursor_col], fill=1)
+                    img.paste(block, (x0, y0))
 
-        # Status bar
-        status_y = PORTRAIT_H - MARGIN_Y - self.cell_h
-        draw.line([(MARGIN_X, status_y - 2), (PORTRAIT_W - MARGIN_X, status_y - 2)], fill=0)
+        return img
 
-        doc_name = os.path.basename(self.doc_path) if self.doc_path else "untitled"
-        save_indicator = "*" if self.dirty else ""
-        line_num = cursor_line + 1
-        col_num = cursor_col + 1
-        status = f"{save_indicator}{doc_name}"
-        draw.text((MARGIN_X, status_y), status, font=self.font, fill=0)
+    def _status_strip(self):
+        """Return (position, image) of the status bar in the landscape frame.
 
-        # Rotate for landscape display
-        img_landscape = img.transpose(Image.Transpose.ROTATE_270)
-        return img_landscape
+        The strip only depends on the document name and dirty flag, so it is
+        drawn once per change and pasted into every other frame.
+        """
+        key = (self.doc_path, self.dirty)
+        if self._status_cache is None or self._status_cache[0] != key:
+            status_y = PORTRAIT_H - MARGIN_Y - self.cell_h
+            frame = Image.new("1", (PORTRAIT_H, PORTRAIT_W), 255)
+            ImageDraw.Draw(frame).line(
+                self._landscape_box(MARGIN_X, status_y - 2,
+                                    PORTRAIT_W - MARGIN_X, status_y - 2), fill=0)
+
+            doc_name = os.path.basename(self.doc_path) if self.doc_path else "untitled"
+            save_indicator = "*" if self.dirty else ""
+            status = f"{save_indicator}{doc_name}"
+            self._draw_string(frame, MARGIN_X, status_y, status)
+
+            x0, y0, x1, y1 = self._landscape_box(0, status_y - 2, PORTRAIT_W - 1,
+                                                 status_y + self.cell_h - 1)
+            strip = frame.crop((x0, y0, x1 + 1, y1 + 1))
+            self._status_cache = (key, (x0, y0), strip)
+        return self._status_cache[1], self._status_cache[2]
 
     # --- Cursor movement helpers ---
 
     def _cursor_up(self):
         """Move cursor up one visual line."""
-        lines, cur_line, cur_col = self._wrap_with_cursor()
-        if cur_line == 0:
-            return  # already at top
-
-        target_line = cur_line - 1
-        target_col = min(cur_col, len(lines[target_line]))
-        self.cursor = self._pos_from_line_col(lines, target_line, target_col)
+        self._cursor_to_line(-1)
 
     def _cursor_down(self):
         """Move cursor down one visual line."""
-        lines, cur_line, cur_col = self._wrap_with_cursor()
-        if cur_line >= len(lines) - 1:
-            return  # already at bottom
+        self._cursor_to_line(+1)
 
-        target_line = cur_line + 1
-        target_col = min(cur_col, len(lines[target_line]))
-        self.cursor = self._pos_from_line_col(lines, target_line, target_col)
+    def _cursor_to_line(self, step):
+        """Move the cursor step visual lines, keeping its column if it fits."""
+        lines, cur_line, cur_col = self._wrap_with_cursor()
+        target_line = cur_line + step
+        if not 0 <= target_line < len(lines):
+            return  # already at top/bottom
+        self.cursor = self._pos_from_line_col(lines, target_line, cur_col)
 
     def _pos_from_line_col(self, lines, target_line, target_col):
-        """Convert a visual (line, col) back to a text character index."""
-        # Rebuild the text position by walking through paragraphs and wrapping
-        cpl = self.chars_per_line
-        text = self.text
-
-        line_idx = 0
-        text_pos = 0
-
-        for para in text.split("\n"):
-            if para == "":
-                if line_idx == target_line:
-                    return text_pos + min(target_col, 0)
-                line_idx += 1
-                text_pos += 1  # the \n character
-                continue
+        """Convert a visual (line, col) back to a text character index.
 
-            wrapped = textwrap.wrap(para, width=cpl,
-                                    break_long_words=True,
-                                    break_on_hyphens=False)
-            if not wrapped:
-                wrapped = [""]
-
-            para_char = 0
-            for w_line in wrapped:
-                if line_idx == target_line:
-                    col = min(target_col, len(w_line))
-                    return text_pos + para_char + col
-                para_char += len(w_line)
-                # Skip the space consumed by wrapping
-                if para_char < len(para) and para[para_char] == " ":
-                    para_char += 1
-                line_idx += 1
-
-            text_pos += len(para) + 1  # +1 for \n
-
-        # Past end of text
-        return len(text)
+        lines must be the current wrap (as returned by _wrap_with_cursor),
+        whose line offsets are kept in _line_starts.
+        """
+        if target_line >= len(lines):
+            return len(self.text)  # past end of text
+        return self._line_starts[target_line] + min(target_col, len(lines[target_line]))
 
     # --- Keyboard input ---
 
@@ -843,8 +1134,9 @@ class EtyperApp:
                 return
             elif keycode == ecodes.KEY_R:
                 # Force full refresh
+                self._flush_display()
                 img = self.render()
-                self.epd.full_refresh(list(img.tobytes()))
+                self.epd.full_refresh(img.tobytes())
                 self.needs_display_update = False
                 return
             elif keycode == ecodes.KEY_LEFT:
@@ -899,35 +1191,90 @@ class EtyperApp:
 
         # Enter
         if keycode == ecodes.KEY_ENTER:
-            self.text = self.text[:self.cursor] + "\n" + self.text[self.cursor:]
-            self.cursor += 1
-            self.dirty = True
-            self.needs_display_update = True
+            self._insert_text("\n")
             return
 
         # Backspace
         if keycode == ecodes.KEY_BACKSPACE:
-            if self.cursor > 0:
-                self.text = self.text[:self.cursor - 1] + self.text[self.cursor:]
-                self.cursor -= 1
-                self.dirty = True
-                self.needs_display_update = True
+            self._erase_back(1)
             return
 
         # Delete
         if keycode == ecodes.KEY_DELETE:
-            if self.cursor < len(self.text):
-                self.text = self.text[:self.cursor] + self.text[self.cursor + 1:]
-                self.dirty = True
-                self.needs_display_update = True
+            self._erase_forward(1)
             return
 
         # Regular characters - insert at cursor position
-        if keycode in self.keymap:
-            normal, shifted = self.keymap[keycode]
-            char = shifted if self.shift_held else normal
-            self.text = self.text[:self.cursor] + char + self.text[self.cursor:]
-            self.cursor += len(char)
+        ch = self.keymap[self.shift_held][keycode]
+        if ch is not None:
+            self._insert_text(ch)
+
+    def _handle_keys(self, events):
+        """Process a batch of (keycode, value) events from one read.
+
+        Runs of typed characters are inserted as one string, and runs of
+        Backspace or Delete removed as one range, so a key-repeat burst
+        costs a single buffer edit and re-wrap instead of one per event.
+        """
+        typed = []
+        erase = 0
+        forward = 0
+        for keycode, value in events:
+            if keycode in MODIFIER_KEYS:
+                self._handle_key(keycode, value)  # state only; runs stay open
+                continue
+            if value == 0:
+                continue  # releases of other keys are ignored anyway
+            if not self.ctrl_held:
+                ch = self.keymap[self.shift_held][keycode]
+                if ch is not None and not (erase or forward):
+                    typed.append(ch)
+                    continue
+                if keycode == ecodes.KEY_BACKSPACE and not (typed or forward):
+                    erase += 1
+                    continue
+                if keycode == ecodes.KEY_DELETE and not (typed or erase):
+                    forward += 1
+                    continue
+
+            # Anything else is applied in order after the pending run
+            self._flush_run(typed, erase, forward)
+            typed = []
+            erase = forward = 0
+            self._handle_key(keycode, value)
+
+        self._flush_run(typed, erase, forward)
+
+    def _flush_run(self, typed, erase, forward):
+        """Apply a run collected by _handle_keys (at most one is non-empty)."""
+        if typed:
+            self._insert_text("".join(typed))
+        elif erase:
+            self._erase_back(erase)
+        elif forward:
+            self._erase_forward(forward)
+
+    def _insert_text(self, s):
+        """Insert s at the cursor and move the cursor past it."""
+        self._replace_text(self.cursor, self.cursor, s)
+        self.cursor += len(s)
+        self.dirty = True
+        self.needs_display_update = True
+
+    def _erase_back(self, n):
+        """Delete up to n characters before the cursor."""
+        start = max(0, self.cursor - n)
+        if start < self.cursor:
+            self._replace_text(start, self.cursor, "")
+            self.cursor = start
+            self.dirty = True
+            self.needs_display_update = True
+
+    def _erase_forward(self, n):
+        """Delete up to n characters after the cursor."""
+        end = min(len(self.text), self.cursor + n)
+        if end > self.cursor:
+            self._replace_text(self.cursor, end, "")
             self.dirty = True
             self.needs_display_update = True
 
@@ -936,6 +1283,7 @@ class EtyperApp:
     def _sleep_mode(self):
         """Save, show goodbye screen, put display to sleep, wait for Ctrl+Q to wake."""
         print("Entering sleep mode...")
+        self._flush_display()
 
         # Show goodbye screen
         if self.epd:
@@ -954,34 +1302,14 @@ class EtyperApp:
         print("Waking up...")
         self.epd.init()
         img = self.render()
-        self.epd.display(list(img.tobytes()))
+        self.epd.display(img.tobytes())
         self.epd.init_partial()
         self.needs_display_update = False
         print("Resumed.")
 
     def _wait_for_wake(self):
         """Block until Ctrl+Q is pressed again on the keyboard."""
-        ctrl_held = False
-        while self.running:
-            if self.keyboard is None:
-                self.keyboard = self._find_keyboard()
-                if self.keyboard is None:
-                    time.sleep(1)
-                    continue
-            try:
-                r, _, _ = select.select([self.keyboard.fd], [], [], 1.0)
-                if not r:
-                    continue
-                for event in self.keyboard.read():
-                    if event.type != ecodes.EV_KEY:
-                        continue
-                    if event.code in (ecodes.KEY_LEFTCTRL, ecodes.KEY_RIGHTCTRL):
-                        ctrl_held = event.value != 0
-                    elif event.code == ecodes.KEY_Q and event.value == 1 and ctrl_held:
-                        return
-            except OSError:
-                self.keyboard = None
-                time.sleep(1)
+        self._wait_for_key_or_timeout(ecodes.KEY_Q)
 
     # --- File server mode (Bluetooth PAN) ---
 
@@ -1004,27 +1332,11 @@ class EtyperApp:
         timeout_min = self.BT_PAN_TIMEOUT // 60
 
         # Show instructions on e-paper
+        self._flush_display()
         self.epd.init()
-        img = Image.new("1", (PORTRAIT_W, PORTRAIT_H), 255)
-        draw = ImageDraw.Draw(img)
-
-        y = MARGIN_Y + 10
-        draw.text((MARGIN_X, y), "-- File Server --", font=self.font, fill=0)
-        y += self.line_h * 2
-        draw.text((MARGIN_X, y), "1. Pair Bluetooth", font=self.font, fill=0)
-        y += self.line_h
-        draw.text((MARGIN_X, y), "   with \"etyper\"", font=self.font, fill=0)
-        y += self.line_h * 2
-        draw.text((MARGIN_X, y), "2. Open browser:", font=self.font, fill=0)
-        y += self.line_h
-        draw.text((MARGIN_X, y), f"   {url}", font=self.font, fill=0)
-        y += self.line_h * 2
-        draw.text((MARGIN_X, y), f"Auto-off: {timeout_min} min", font=self.font, fill=0)
-        y += self.line_h
-        draw.text((MARGIN_X, y), "Ctrl+F to stop", font=self.font, fill=0)
-
-        img_landscape = img.transpose(Image.Transpose.ROTATE_270)
-        self.epd.display(list(img_landscape.tobytes()))
+        if self._server_screen is None:
+            self._server_screen = self._render_server_screen(url, timeout_min)
+        self.epd.display(self._server_screen)
 
         # Start Bluetooth PAN and file server
         bt_state = self._start_bt_pan()
@@ -1067,29 +1379,64 @@ class EtyperApp:
 
         self._resume_typewriter_display()
 
+    def _render_server_screen(self, url, timeout_min):
+        """Draw the file server instructions with the cached glyph tiles and
+        return the frame bytes (the text is fixed, so this runs once)."""
+        img = Image.new("1", (PORTRAIT_H, PORTRAIT_W), 255)
+        lines = [
+            (10, "-- File Server --"),
+            (self.line_h * 2, "1. Pair Bluetooth"),
+            (self.line_h, "   with \"etyper\""),
+            (self.line_h * 2, "2. Open browser:"),
+            (self.line_h, f"   {url}"),
+            (self.line_h * 2, f"Auto-off: {timeout_min} min"),
+            (self.line_h, "Ctrl+F to stop"),
+        ]
+        y = MARGIN_Y
+        for gap, text in lines:
+            y += gap
+            self._draw_string(img, MARGIN_X, y, text)
+        return img.tobytes()
+
     def _resume_typewriter_display(self):
         """Reinitialize display and show typewriter screen."""
         time.sleep(1)
         self.epd.init()
         img = self.render()
-        self.epd.display(list(img.tobytes()))
+        self.epd.display(img.tobytes())
         self.epd.init_partial()
         self.needs_display_update = False
 
+    def _ensure_bt_agent(self):
+        """Set up D-Bus plumbing for Bluetooth once and return the system bus.
+
+        The mainloop, bus connection, agent object and the GLib loop thread
+        that dispatches agent calls live for the whole process; each Ctrl+F
+        session only registers and unregisters the agent with BlueZ.
+        """
+        # Set up D-Bus mainloop only once (repeated calls cause conflicts)
+        if not self._dbus_mainloop_set:
+            dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+            self._dbus_mainloop_set = True
+
+        if self._bt_bus is None:
+            self._bt_bus = dbus.SystemBus()
+
+        if self._bt_agent is None:
+            self._bt_agent = _BtAutoAcceptAgent(self._bt_bus, self.BT_AGENT_PATH)
+
+        if self._glib_loop is None:
+            self._glib_loop = GLib.MainLoop()
+            threading.Thread(target=self._glib_loop.run, daemon=True).start()
+
+        return self._bt_bus
+
     def _start_bt_pan(self):
         """Set up Bluetooth PAN: agent, bridge, NAP, DHCP. Returns state dict or None."""
         print("Starting Bluetooth PAN...")
 
         try:
-            # Set up D-Bus mainloop only once (repeated calls cause conflicts)
-            if not self._dbus_mainloop_set:
-                dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
-                self._dbus_mainloop_set = True
-
-            # Reuse bus connection (D-Bus returns same conn anyway, but be explicit)
-            if self._bt_bus is None:
-                self._bt_bus = dbus.SystemBus()
-            bus = self._bt_bus
+            bus = self._ensure_bt_agent()
 
             # Power on adapter
             props = dbus.Interface(
@@ -1099,9 +1446,7 @@ class EtyperApp:
             props.Set("org.bluez.Adapter1", "Powered", True)
             time.sleep(0.5)
 
-            # Register auto-accept agent (reuse if already created)
-            if self._bt_agent is None:
-                self._bt_agent = _BtAutoAcceptAgent(bus, self.BT_AGENT_PATH)
+            # Register the auto-accept agent with BlueZ
             mgr = dbus.Interface(
                 bus.get_object("org.bluez", "/org/bluez"),
                 "org.bluez.AgentManager1",
@@ -1122,29 +1467,33 @@ class EtyperApp:
             props.Set("org.bluez.Adapter1", "PairableTimeout", dbus.UInt32(0))
             print("  BT adapter: etyper, discoverable, pairable")
 
-            # Create bridge for PAN
-            subprocess.run(["ip", "link", "del", self.BT_PAN_BRIDGE],
-                           capture_output=True)
-            time.sleep(0.5)
-            r = subprocess.run(
-                ["ip", "link", "add", self.BT_PAN_BRIDGE, "type", "bridge"],
-                capture_output=True, text=True,
-            )
-            if r.returncode != 0:
-                print(f"  Bridge creation failed: {r.stderr}")
-                mgr.UnregisterAgent(self.BT_AGENT_PATH)
-                return None
-            subprocess.run(
-                ["ip", "addr", "add", f"{self.BT_PAN_IP}/24", "dev", self.BT_PAN_BRIDGE],
-                capture_output=True,
-            )
-            subprocess.run(
-                ["ip", "link", "set", self.BT_PAN_BRIDGE, "up"],
-                capture_output=True,
-            )
-            subprocess.run(["sysctl", "-w", "net.ipv4.ip_forward=1"],
-                           capture_output=True)
-            print(f"  Bridge {self.BT_PAN_BRIDGE} up @ {self.BT_PAN_IP}")
+            br = self.BT_PAN_BRIDGE
+            if self._bt_bridge_up and os.path.isdir(f"/sys/class/net/{br}"):
+                # Left configured by the previous file server session
+                print(f"  Bridge {br} reused @ {self.BT_PAN_IP}")
+            else:
+                # Create bridge for PAN: one ip process for all steps. -force
+                # keeps going past the delete of a bridge that doesn't exist,
+                # so check the result in sysfs rather than the exit status.
+                r = subprocess.run(
+                    ["ip", "-force", "-batch", "-"],
+                    input=(f"link del {br}\n"
+                           f"link add {br} type bridge\n"
+                           f"addr add {self.BT_PAN_IP}/24 dev {br}\n"
+                           f"link set {br} up\n"),
+                    capture_output=True, text=True,
+                )
+                if not os.path.isdir(f"/sys/class/net/{br}"):
+                    print(f"  Bridge creation failed: {r.stderr}")
+                    mgr.UnregisterAgent(self.BT_AGENT_PATH)
+                    return None
+                try:
+                    with open("/proc/sys/net/ipv4/ip_forward", "w") as f:
+                        f.write("1")
+                except OSError:
+                    pass
+                self._bt_bridge_up = True
+                print(f"  Bridge {br} up @ {self.BT_PAN_IP}")
 
             # Register NAP server on the bridge
             net_server = dbus.Interface(
@@ -1169,11 +1518,6 @@ class EtyperApp:
             ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             print("  DHCP server running")
 
-            # Start GLib mainloop for D-Bus event processing
-            loop = GLib.MainLoop()
-            loop_thread = threading.Thread(target=loop.run, daemon=True)
-            loop_thread.start()
-
             print("Bluetooth PAN ready. Waiting for connections...")
             return {
                 "bus": bus,
@@ -1182,7 +1526,6 @@ class EtyperApp:
                 "props": props,
                 "net_server": net_server,
                 "dnsmasq": dnsmasq,
-                "loop": loop,
             }
 
         except Exception as e:
@@ -1192,8 +1535,7 @@ class EtyperApp:
                 dnsmasq.terminate()
             except Exception:
                 pass
-            subprocess.run(["ip", "link", "del", self.BT_PAN_BRIDGE],
-                           capture_output=True)
+            self._remove_bt_bridge()
             self._bt_power_off()
             return None
 
@@ -1215,42 +1557,41 @@ class EtyperApp:
             except Exception:
                 pass
 
-        # 2. Stop GLib mainloop
-        try:
-            state["loop"].quit()
-        except Exception as e:
-            print(f"  mainloop stop warning: {e}")
-
-        # 3. Unregister NAP server
+        # 2. Unregister NAP server
         try:
             state["net_server"].Unregister("nap")
         except Exception as e:
             print(f"  NAP unregister warning: {e}")
 
-        # 4. Make adapter non-discoverable
+        # 3. Make adapter non-discoverable
         try:
             state["props"].Set("org.bluez.Adapter1", "Discoverable", False)
             state["props"].Set("org.bluez.Adapter1", "Pairable", False)
         except Exception as e:
             print(f"  adapter config warning: {e}")
 
-        # 5. Unregister agent from BlueZ (keep self._bt_agent for reuse)
+        # 4. Unregister agent from BlueZ (keep self._bt_agent for reuse)
         try:
             state["mgr"].UnregisterAgent(self.BT_AGENT_PATH)
         except Exception as e:
             print(f"  agent unregister warning: {e}")
 
-        # 6. Disconnect all connected BT devices
+        # 5. Disconnect all connected BT devices
         self._bt_disconnect_all()
 
-        # 7. Remove bridge
-        subprocess.run(["ip", "link", "del", self.BT_PAN_BRIDGE],
-                       capture_output=True)
+        # The bridge stays up for the next session (removed on exit); with
+        # dnsmasq and NAP gone and the adapter off, nothing can reach it.
 
-        # 8. Power off Bluetooth adapter
+        # 6. Power off Bluetooth adapter
         self._bt_power_off()
         print("Bluetooth PAN stopped.")
 
+    def _remove_bt_bridge(self):
+        """Delete the PAN bridge so the next session creates it afresh."""
+        subprocess.run(["ip", "link", "del", self.BT_PAN_BRIDGE],
+                       capture_output=True)
+        self._bt_bridge_up = False
+
     @staticmethod
     def _bt_power_off():
         """Power off the Bluetooth adapter via bluetoothctl."""
@@ -1345,6 +1686,8 @@ class EtyperApp:
                 print("Could not generate SSL certificate.")
                 return None
 
+        index_cache = {"page": (None, b"")}  # (docs dir mtime, index html)
+
         class DocsHandler(SimpleHTTPRequestHandler):
             """Serve document listing and file downloads."""
 
@@ -1359,11 +1702,26 @@ class EtyperApp:
                     self.send_error(404)
 
             def _serve_index(self):
-                files = sorted(
-                    f for f in os.listdir(docs_dir)
-                    if f.endswith(".txt") and f.startswith("doc_")
-                )
-                html = (
+                # Documents are saved via rename, so any add, remove or save
+                # bumps the directory mtime; reuse the page until it changes.
+                # Stored as one tuple so concurrent requests see a matching pair.
+                mtime = os.stat(docs_dir).st_mtime_ns
+                cached_mtime, data = index_cache["page"]
+                if cached_mtime != mtime:
+                    data = self._build_index()
+                    index_cache["page"] = (mtime, data)
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", len(data))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _build_index(self):
+                with os.scandir(docs_dir) as it:
+                    entries = [e for e in it
+                               if e.name.endswith(".txt") and e.name.startswith("doc_")]
+                entries.sort(key=lambda e: e.name, reverse=True)  # newest first
+                parts = [
                     "<!DOCTYPE html><html><head>"
                     "<meta charset='utf-8'>"
                     "<meta name='viewport' content='width=device-width,initial-scale=1'>"
@@ -1382,70 +1740,72 @@ class EtyperApp:
                     ".dl-all a:hover{background:#444}"
                     "</style></head><body>"
                     "<h1>etyper documents</h1>"
-                )
-                if not files:
-                    html += "<p>No documents yet.</p>"
+                ]
+                if not entries:
+                    parts.append("<p>No documents yet.</p>")
                 else:
-                    for f in reversed(files):
-                        fpath = os.path.join(docs_dir, f)
-                        size = os.path.getsize(fpath)
-                        if size < 1024:
-                            size_str = f"{size} B"
-                        else:
-                            size_str = f"{size / 1024:.1f} KB"
-                        html += (
-                            f"<a href='/dl/{quote(f)}'>"
-                            f"{f} <span class='meta'>({size_str})</span></a>"
-                        )
-                    html += (
+                    parts.extend(
+                        f"<a href='/dl/{quote(e.name)}'>{e.name} "
+                        f"<span class='meta'>({self._fmt_size(e.stat().st_size)})</span></a>"
+                        for e in entries
+                    )
+                    parts.append(
                         "<div class='dl-all'>"
                         "<a href='/download-all'>Download all as .zip</a>"
                         "</div>"
                     )
-                html += "</body></html>"
-                data = html.encode()
-                self.send_response(200)
-                self.send_header("Content-Type", "text/html; charset=utf-8")
-                self.send_header("Content-Length", len(data))
-                self.end_headers()
-                self.wfile.write(data)
+                parts.append("</body></html>")
+                return "".join(parts).encode()
+
+            @staticmethod
+            def _fmt_size(size):
+                if size < 1024:
+                    return f"{size} B"
+                return f"{size / 1024:.1f} KB"
 
             def _serve_file(self, filename):
                 fpath = os.path.join(docs_dir, os.path.basename(filename))
-                if not os.path.isfile(fpath):
+                try:
+                    f = open(fpath, "rb")
+                except OSError:  # missing, a directory, or unreadable
                     self.send_error(404)
                     return
-                data = open(fpath, "rb").read()
-                self.send_response(200)
-                self.send_header("Content-Type", "text/plain; charset=utf-8")
-                self.send_header("Content-Disposition",
-                                 f"attachment; filename=\"{os.path.basename(fpath)}\"")
-                self.send_header("Content-Length", len(data))
-                self.end_headers()
-                self.wfile.write(data)
+                with f:
+                    size = os.fstat(f.fileno()).st_size
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/plain; charset=utf-8")
+                    self.send_header("Content-Disposition",
+                                     f"attachment; filename=\"{os.path.basename(fpath)}\"")
+                    self.send_header("Content-Length", size)
+                    self.end_headers()
+                    # socket.sendfile uses os.sendfile on a plain socket and
+                    # falls back to buffered sends through TLS
+                    self.connection.sendfile(f, 0, size)
 
             def _serve_zip(self):
                 import zipfile
-                import io
-                buf = io.BytesIO()
-                with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-                    for f in os.listdir(docs_dir):
-                        if f.endswith(".txt") and f.startswith("doc_"):
-                            zf.write(os.path.join(docs_dir, f), f)
-                data = buf.getvalue()
+                # Stream the archive straight to the socket instead of building
+                # it in memory. The server speaks HTTP/1.0, so the body simply
+                # ends when the connection closes and needs no Content-Length.
+                # Text files are small, so store them rather than deflate.
                 self.send_response(200)
                 self.send_header("Content-Type", "application/zip")
                 self.send_header("Content-Disposition",
                                  "attachment; filename=\"etyper_docs.zip\"")
-                self.send_header("Content-Length", len(data))
                 self.end_headers()
-                self.wfile.write(data)
+                with zipfile.ZipFile(self.wfile, "w", zipfile.ZIP_STORED) as zf:
+                    for f in os.listdir(docs_dir):
+                        if f.endswith(".txt") and f.startswith("doc_"):
+                            zf.write(os.path.join(docs_dir, f), f)
 
             def log_message(self, format, *args):
                 print(f"  [http] {args[0]}")
 
-        class _ReuseHTTPServer(HTTPServer):
+        class _ReuseHTTPServer(ThreadingHTTPServer):
+            # One thread per connection, so a slow download doesn't hold up
+            # the index for other clients
             allow_reuse_address = True
+            daemon_threads = True
 
         try:
             server = _ReuseHTTPServer(("0.0.0.0", port), DocsHandler)
@@ -1464,26 +1824,22 @@ class EtyperApp:
     def _wait_for_key_or_timeout(self, target_key, timeout=0):
         """Block until Ctrl+<target_key> is pressed or timeout expires (0=no timeout)."""
         ctrl_held = False
-        start = time.time()
+        start = time.monotonic()
         while self.running:
-            if timeout > 0 and time.time() - start >= timeout:
+            if timeout > 0 and time.monotonic() - start >= timeout:
                 print("Timeout reached.")
                 return
             if self.keyboard is None:
-                self.keyboard = self._find_keyboard()
-                if self.keyboard is None:
-                    time.sleep(1)
+                if self._wait_for_keyboard() is None:
                     continue
             try:
                 r, _, _ = select.select([self.keyboard.fd], [], [], 1.0)
                 if not r:
                     continue
-                for event in self.keyboard.read():
-                    if event.type != ecodes.EV_KEY:
-                        continue
-                    if event.code in (ecodes.KEY_LEFTCTRL, ecodes.KEY_RIGHTCTRL):
-                        ctrl_held = event.value != 0
-                    elif event.code == target_key and event.value == 1 and ctrl_held:
+                for keycode, value in self._read_key_events():
+                    if keycode in (ecodes.KEY_LEFTCTRL, ecodes.KEY_RIGHTCTRL):
+                        ctrl_held = value != 0
+                    elif keycode == target_key and value == 1 and ctrl_held:
                         return
             except OSError:
                 self.keyboard = None
@@ -1512,13 +1868,16 @@ class EtyperApp:
         print("Initial display refresh...")
         self.epd.init()
         img = self.render()
-        self.epd.display(list(img.tobytes()))
+        self.epd.display(img.tobytes())
         self.epd.init_partial()
 
         self.keyboard = self._find_keyboard()
 
+        self._display_thread = threading.Thread(target=self._display_worker, daemon=True)
+        self._display_thread.start()
+
         self.running = True
-        self.last_save_time = time.time()
+        self.last_save_time = time.monotonic()
         self.needs_display_update = False
 
         def signal_handler(sig, frame):
@@ -1538,23 +1897,20 @@ class EtyperApp:
         """Event loop: read keyboard, update display, autosave."""
         while self.running:
             if self.keyboard is None:
-                self.keyboard = self._find_keyboard()
-                if self.keyboard is None:
-                    time.sleep(1)
+                if self._wait_for_keyboard() is None:
                     self._check_autosave()
                     continue
 
             try:
-                r, _, _ = select.select([self.keyboard.fd], [], [], 0.5)
+                r, _, _ = select.select([self.keyboard.fd], [], [],
+                                        self._idle_timeout())
 
                 if r:
-                    for event in self.keyboard.read():
-                        if event.type == ecodes.EV_KEY:
-                            self._handle_key(event.code, event.value)
+                    self._handle_keys(self._read_key_events())
 
                 if self.needs_display_update:
-                    img = self.render()
-                    self.epd.display_image_partial(img)
+                    # render() already yields a panel-sized 1-bit frame
+                    self._submit_frame(self.render().tobytes())
                     self.needs_display_update = False
 
                 self._check_autosave()
@@ -1564,8 +1920,72 @@ class EtyperApp:
                 self.keyboard = None
                 time.sleep(1)
 
+    def _display_worker(self):
+        """Push queued frames to the panel so partial refreshes don't block input."""
+        while True:
+            frame = self._frame_q.get()
+            try:
+                if frame is None:
+                    return
+                self.epd.display_partial(frame)
+            except Exception as e:
+                print(f"Display update failed: {e}")
+            finally:
+                self._frame_q.task_done()
+
+    def _submit_frame(self, frame):
+        """Queue a frame for partial refresh, replacing any not yet started.
+
+        While the panel is busy, keystrokes keep updating the single slot and
+        only the newest frame is drawn when it frees up.
+        """
+        try:
+            self._frame_q.get_nowait()
+            self._frame_q.task_done()  # dropped, never displayed
+        except queue.Empty:
+            pass
+        self._frame_q.put(frame)
+
+    def _flush_display(self):
+        """Wait for queued frames to reach the panel before driving it directly."""
+        if self._display_thread is not None:
+            self._frame_q.join()
+
+    def _read_key_events(self):
+        """Drain everything queued on the keyboard and return its key events.
+
+        Keeps reading while more input is ready so a key-repeat burst is
+        handled as one batch and followed by a single render.
+
+        Returns:
+            list of (keycode, value) tuples in arrival order.
+        """
+        events = []
+        fd = self.keyboard.fd
+        while True:
+            # Parse input_event records directly instead of building
+            # evdev InputEvent objects for every key press, release and SYN
+            try:
+                data = os.read(fd, EVENT_SIZE * EVENT_BATCH)
+            except BlockingIOError:
+                break
+            for _, _, etype, code, value in struct.iter_unpack(EVENT_FMT, data):
+                if etype == ecodes.EV_KEY:
+                    events.append((code, value))
+            if len(data) < EVENT_SIZE * EVENT_BATCH:
+                break  # short read: queue is empty
+        return events
+
+    def _idle_timeout(self):
+        """Seconds the main loop may wait for input: until an autosave is
+        due, but never longer than MAX_IDLE_WAIT."""
+        if not self.dirty:
+            return MAX_IDLE_WAIT
+        due = self.last_save_time + AUTOSAVE_INTERVAL - time.monotonic()
+        return min(MAX_IDLE_WAIT, max(0.0, due))
+
     def _check_autosave(self):
-        if self.dirty and (time.time() - self.last_save_time >= AUTOSAVE_INTERVAL):
+        if self.dirty and (time.monotonic() - self.last_save_time >= AUTOSAVE_INTERVAL):
             self.save_document()
             print(f"Autosaved: {self.doc_path}")
 
@@ -1576,6 +1996,10 @@ class EtyperApp:
             print(f"Saved: {self.doc_path}")
 
         if self.epd:
+            self._flush_display()
+            if self._display_thread is not None:
+                self._frame_q.put(None)  # stop the worker
+                self._display_thread.join()
             try:
                 self.epd.init()
                 self.epd.clear(color=0xFF)
@@ -1584,6 +2008,9 @@ class EtyperApp:
                 pass
             self.epd.close()
 
+        if self._bt_bridge_up:
+            self._remove_bt_bridge()
+
         print("Done.")
 
 